@@ -6,7 +6,7 @@
 #     "rich",
 #     "platformdirs",
 #     "readchar",
-#     "httpx",
+#     "httpx[http2]",
 # ]
 # ///
 """
@@ -22,25 +22,31 @@ Or install globally:
     specify init --here
 """
 
+import atexit
+import errno
+import fnmatch
+import functools
+import itertools
 import os
 import subprocess
 import sys
 import zipfile
 import tempfile
+import threading
 import shutil
+import stat
 import shlex
 import json
 import re
+import time
 from pathlib import Path
-from typing import Optional, Sequence, Tuple, List
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, BinaryIO, Callable, NamedTuple, Optional, Sequence, Tuple, List
 
 import typer
-import httpx
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.text import Text
-from rich.live import Live
 from rich.align import Align
 from rich.table import Table
 from .paths import get_specs_root, get_specify_root, specify_scripts_dir, specify_templates_dir
@@ -49,11 +55,51 @@ from typer.core import TyperGroup
 
 # For cross-platform keyboard input
 import readchar
-import ssl
-import truststore
 
-ssl_context = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-client = httpx.Client(verify=ssl_context)
+if TYPE_CHECKING:
+    import ssl
+
+    import httpx
+    from rich.progress import Progress
+
+# Networking modules (httpx, truststore) are imported on first use so that commands such as
+# `specify version` or `--help` do not pay for them.
+_SSL_CTX: "ssl.SSLContext | None" = None
+
+# Shared keep-alive client so the GitHub API call and every asset download reuse one pooled connection
+_HTTPX_CLIENT: "httpx.Client | None" = None
+
+
+def _get_ssl_context() -> "ssl.SSLContext":
+    """Return the system trust store SSL context, creating it on first use."""
+    global _SSL_CTX
+    if _SSL_CTX is None:
+        import ssl
+        import truststore
+
+        _SSL_CTX = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    return _SSL_CTX
+
+
+def _new_client(verify: "ssl.SSLContext | bool") -> "httpx.Client":
+    """Create an HTTP/2 client with the pooling and timeouts used for all GitHub traffic."""
+    import httpx
+
+    return httpx.Client(
+        http2=True,
+        verify=verify,
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=20, keepalive_expiry=30),
+        timeout=httpx.Timeout(30.0, connect=10.0),
+    )
+
+
+def _get_client() -> "httpx.Client":
+    """Return the process-wide HTTP/2 client, creating it on first use."""
+    global _HTTPX_CLIENT
+    if _HTTPX_CLIENT is None:
+        _HTTPX_CLIENT = _new_client(_get_ssl_context())
+        atexit.register(_HTTPX_CLIENT.close)
+    return _HTTPX_CLIENT
 
 def _github_token(cli_token: str | None = None) -> str | None:
     """Return sanitized GitHub token (cli arg takes precedence) or None."""
@@ -93,12 +139,50 @@ AGENT_DIRECTORY_MAP = {
     "roo": ".roo/",
 }
 
-AGENT_ROOT_NAMES = {key: Path(path).parts[0] for key, path in AGENT_DIRECTORY_MAP.items()}
+AGENT_ROOT_NAMES = {key: path.partition("/")[0] for key, path in AGENT_DIRECTORY_MAP.items()}
+
+
+# Slash commands listed first in the Next Steps panel, in workflow order
+_CORE_COMMANDS = ("constitution", "specify", "clarify", "plan", "tasks", "analyze", "implement")
+_CORE_RANK = {name: rank for rank, name in enumerate(_CORE_COMMANDS)}
+
+
+class _AgentPlan(NamedTuple):
+    """How one selected agent's template is merged into the project during init."""
+    ai_key: str
+    top_level: list[str] | None
+    preserve_specs: bool
+    label: str
+
 # Add script type choices
 SCRIPT_TYPE_CHOICES = {"sh": "POSIX Shell (bash/zsh)", "ps": "PowerShell"}
 
+# Tools reported by `specify check`: (executable, tracker label)
+_CHECK_TOOLS = (
+    ("git", "Git version control"),
+    ("claude", "Claude Code CLI"),
+    ("gemini", "Gemini CLI"),
+    ("qwen", "Qwen Code CLI"),
+    ("code", "Visual Studio Code"),
+    ("code-insiders", "Visual Studio Code Insiders"),
+    ("cursor-agent", "Cursor IDE agent"),
+    ("windsurf", "Windsurf IDE"),
+    ("kilocode", "Kilo Code IDE"),
+    ("opencode", "opencode"),
+    ("codex", "Codex CLI"),
+    ("auggie", "Auggie CLI"),
+)
+# The subset of _CHECK_TOOLS that are AI assistant CLIs (editors and git excluded)
+_AI_ASSISTANT_TOOLS = ("claude", "gemini", "cursor-agent", "qwen", "windsurf", "kilocode", "opencode", "codex", "auggie")
+
 # Keep a module version (mirrors pyproject.toml). Update alongside pyproject version bump.
-__version__ = "0.0.57"
+__version__ = "0.0.58"
+
+# Downloaded archives up to this size are extracted straight from memory instead of a file in the cwd
+_SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+# Archives with fewer members than this are decompressed on one thread (pool overhead outweighs the gain)
+_PARALLEL_EXTRACT_MIN_MEMBERS = 16
 
 # Claude CLI local installation path after migrate-installer
 CLAUDE_LOCAL_PATH = Path.home() / ".claude" / "local" / "claude"
@@ -114,23 +198,55 @@ BANNER = """
 """
 
 TAGLINE = "GitHub Spec Kit - Spec-Driven Development Toolkit"
+
+# Shown after `init` whenever Codex is among the selected agents (static, so built once)
+_CODEX_WARNING_TEXT = """[bold yellow]Important Note:[/bold yellow]
+
+Custom prompts do not yet support arguments in Codex. You may need to manually specify additional project instructions directly in prompt files located in [cyan].codex/prompts/[/cyan].
+
+For more information, see: [cyan]https://github.com/openai/codex/issues/2890[/cyan]"""
+_CODEX_WARNING_PANEL = Panel(_CODEX_WARNING_TEXT, title="Slash Commands in Codex", border_style="yellow", padding=(1,2))
+
+
 class StepTracker:
     """Track and render hierarchical steps without emojis, similar to Claude Code tree output.
-    Supports live auto-refresh via an attached refresh callback.
+    Supports live auto-refresh via an attached refresh callback, throttled to ~30 Hz.
+    Step updates may come from several threads; changes to the step table are serialized.
     """
+    REFRESH_INTERVAL = 1 / 30  # seconds between refresh callbacks
+
     def __init__(self, title: str):
         self.title = title
         self.steps = []  # list of dicts: {key, label, status, detail}
+        self._by_key: dict[str, dict] = {}  # key -> the same dict held in self.steps
         self.status_order = {"pending": 0, "running": 1, "done": 2, "error": 3, "skipped": 4}
         self._refresh_cb = None  # callable to trigger UI refresh
+        self._last_refresh = 0.0
+        self._render_cache: dict[str, tuple[tuple, str]] = {}  # key -> ((status, detail, label), line)
+        self._lock = threading.Lock()  # guards steps/_by_key mutations
 
     def attach_refresh(self, cb):
         self._refresh_cb = cb
 
     def add(self, key: str, label: str):
-        if key not in [s["key"] for s in self.steps]:
-            self.steps.append({"key": key, "label": label, "status": "pending", "detail": ""})
-            self._maybe_refresh()
+        with self._lock:
+            if key in self._by_key:
+                return
+            self._add(key, label)
+        self._maybe_refresh()
+
+    def add_many(self, steps):
+        """Add several (key, label) steps with a single refresh."""
+        with self._lock:
+            for key, label in steps:
+                if key not in self._by_key:
+                    self._add(key, label)
+        self._maybe_refresh()
+
+    def _add(self, key: str, label: str):
+        step = {"key": key, "label": label, "status": "pending", "detail": ""}
+        self.steps.append(step)
+        self._by_key[key] = step
 
     def start(self, key: str, detail: str = ""):
         self._update(key, status="running", detail=detail)
@@ -138,6 +254,13 @@ class StepTracker:
     def complete(self, key: str, detail: str = ""):
         self._update(key, status="done", detail=detail)
 
+    def complete_many(self, keys, detail: str = ""):
+        """Mark several steps done with the same detail, refreshing once for the batch."""
+        with self._lock:
+            for key in keys:
+                self._set(key, "done", detail)
+        self._maybe_refresh()
+
     def error(self, key: str, detail: str = ""):
         self._update(key, status="error", detail=detail)
 
@@ -145,61 +268,84 @@ class StepTracker:
         self._update(key, status="skipped", detail=detail)
 
     def _update(self, key: str, status: str, detail: str):
-        for s in self.steps:
-            if s["key"] == key:
-                s["status"] = status
-                if detail:
-                    s["detail"] = detail
-                self._maybe_refresh()
-                return
-        # If not present, add it
-        self.steps.append({"key": key, "label": key, "status": status, "detail": detail})
+        with self._lock:
+            self._set(key, status, detail)
         self._maybe_refresh()
 
+    def _set(self, key: str, status: str, detail: str):
+        step = self._by_key.get(key)
+        if step is None:
+            # If not present, add it
+            step = {"key": key, "label": key, "status": status, "detail": detail}
+            self.steps.append(step)
+            self._by_key[key] = step
+        else:
+            step["status"] = status
+            if detail:
+                step["detail"] = detail
+
     def _maybe_refresh(self):
-        if self._refresh_cb:
-            try:
-                self._refresh_cb()
-            except Exception:
-                pass
+        if not self._refresh_cb:
+            return
+        now = time.monotonic()
+        if now - self._last_refresh < self.REFRESH_INTERVAL:
+            return
+        self._last_refresh = now
+        try:
+            self._refresh_cb()
+        except Exception:
+            pass
 
-    def render(self):
-        tree = Tree(f"[cyan]{self.title}[/cyan]", guide_style="grey50")
-        for step in self.steps:
-            label = step["label"]
-            detail_text = step["detail"].strip() if step["detail"] else ""
-
-            # Circles (unchanged styling)
-            status = step["status"]
-            if status == "done":
-                symbol = "[green]●[/green]"
-            elif status == "pending":
-                symbol = "[green dim]○[/green dim]"
-            elif status == "running":
-                symbol = "[cyan]○[/cyan]"
-            elif status == "error":
-                symbol = "[red]●[/red]"
-            elif status == "skipped":
-                symbol = "[yellow]○[/yellow]"
-            else:
-                symbol = " "
+    def _render_line(self, step: dict) -> str:
+        """Return the styled tree line for step, rebuilt only when its content changed."""
+        cache_key = (step["status"], step["detail"], step["label"])
+        cached = self._render_cache.get(step["key"])
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+        # Build from the snapshot only, so the cached line always matches its key
+        status, detail, label = cache_key
+        detail_text = detail.strip() if detail else ""
+
+        # Circles (unchanged styling)
+        if status == "done":
+            symbol = "[green]●[/green]"
+        elif status == "pending":
+            symbol = "[green dim]○[/green dim]"
+        elif status == "running":
+            symbol = "[cyan]○[/cyan]"
+        elif status == "error":
+            symbol = "[red]●[/red]"
+        elif status == "skipped":
+            symbol = "[yellow]○[/yellow]"
+        else:
+            symbol = " "
 
-            if status == "pending":
-                # Entire line light gray (pending)
-                if detail_text:
-                    line = f"{symbol} [bright_black]{label} ({detail_text})[/bright_black]"
-                else:
-                    line = f"{symbol} [bright_black]{label}[/bright_black]"
+        if status == "pending":
+            # Entire line light gray (pending)
+            if detail_text:
+                line = f"{symbol} [bright_black]{label} ({detail_text})[/bright_black]"
             else:
-                # Label white, detail (if any) light gray in parentheses
-                if detail_text:
-                    line = f"{symbol} [white]{label}[/white] [bright_black]({detail_text})[/bright_black]"
-                else:
-                    line = f"{symbol} [white]{label}[/white]"
+                line = f"{symbol} [bright_black]{label}[/bright_black]"
+        else:
+            # Label white, detail (if any) light gray in parentheses
+            if detail_text:
+                line = f"{symbol} [white]{label}[/white] [bright_black]({detail_text})[/bright_black]"
+            else:
+                line = f"{symbol} [white]{label}[/white]"
+
+        self._render_cache[step["key"]] = (cache_key, line)
+        return line
 
-            tree.add(line)
+    def render(self):
+        tree = Tree(f"[cyan]{self.title}[/cyan]", guide_style="grey50")
+        for step in self.steps:
+            tree.add(self._render_line(step))
         return tree
 
+    def __rich__(self):
+        return self.render()
+
 
 
 MINI_BANNER = """
@@ -246,6 +392,8 @@ def select_with_arrows(options: dict, prompt_text: str = "Select an option", def
     Returns:
         Selected option key
     """
+    from rich.live import Live
+
     option_keys = list(options.keys())
     if default_key and default_key in option_keys:
         selected_index = option_keys.index(default_key)
@@ -312,6 +460,10 @@ def select_with_arrows(options: dict, prompt_text: str = "Select an option", def
 
 
 
+_AI_SPLIT_RE = re.compile(r"[\s,]+")
+_AI_STRIP_CHARS = '[]"\''
+
+
 def _tokenize_ai_value(raw: str) -> List[str]:
     """Split a raw --ai token into normalized agent keys."""
     if raw is None:
@@ -321,7 +473,11 @@ def _tokenize_ai_value(raw: str) -> List[str]:
         return []
     if token.startswith("[") and token.endswith("]"):
         token = token[1:-1]
-    parts = [segment.strip().strip('[]"\'"') for segment in re.split(r"[\s,]+", token) if segment.strip()]
+    # Common case: a single bare agent name such as "claude" needs no regex split
+    if "," not in token and not any(c.isspace() for c in token):
+        part = token.strip(_AI_STRIP_CHARS)
+        return [part.lower()] if part else []
+    parts = (segment.strip(_AI_STRIP_CHARS) for segment in _AI_SPLIT_RE.split(token))
     return [part.lower() for part in parts if part]
 
 
@@ -349,28 +505,38 @@ def human_join(items: Sequence[str]) -> str:
     return ", ".join(filtered[:-1]) + f", and {filtered[-1]}"
 
 
+@functools.lru_cache(maxsize=32)
+def _list_dir_entries(base_dir: str) -> tuple[tuple[str, bool, bool], ...]:
+    """Snapshot (name, is_dir, is_file) for every entry of base_dir.
+
+    Cached so that several agents resolved against the same --template-path share one scan.
+    """
+    with os.scandir(base_dir) as entries:
+        return tuple((entry.name, entry.is_dir(), entry.is_file()) for entry in entries)
+
+
 def find_agent_template_variant(base_dir: Path, agent: str, script_type: str) -> Path | None:
     """Locate a prebuilt agent template under base_dir for the given script type."""
+    entries = _list_dir_entries(str(base_dir.resolve()))
+
     # Prefer directories first so we avoid repeated extraction work when available.
     dir_patterns = [
         f"sdd-{agent}-package-{script_type}",
         f"sdd-{agent}-package-{script_type}-*",
     ]
     for pattern in dir_patterns:
-        candidates = sorted(base_dir.glob(pattern))
-        for candidate in reversed(candidates):
-            if candidate.is_dir():
-                return candidate
+        matches = sorted(name for name, is_dir, _ in entries if is_dir and fnmatch.fnmatch(name, pattern))
+        if matches:
+            return base_dir / matches[-1]
 
     zip_patterns = [
         f"spec-kit-template-{agent}-{script_type}.zip",
         f"spec-kit-template-{agent}-{script_type}-*.zip",
     ]
     for pattern in zip_patterns:
-        candidates = sorted(base_dir.glob(pattern))
-        for candidate in reversed(candidates):
-            if candidate.is_file():
-                return candidate
+        matches = sorted(name for name, _, is_file in entries if is_file and fnmatch.fnmatch(name, pattern))
+        if matches:
+            return base_dir / matches[-1]
     return None
 
 
@@ -455,9 +621,65 @@ def run_command(cmd: list[str], check_return: bool = True, capture: bool = False
         return None
 
 
+@functools.lru_cache(maxsize=1)
+def _path_index(path_env: str) -> dict[str, tuple[str, ...]]:
+    """Map executable names to the PATH entries that provide them, in PATH order."""
+    windows = os.name == "nt"
+    exts: set[str] = set()
+    if windows:
+        exts = {ext.lower() for ext in os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD").split(os.pathsep) if ext}
+    index: dict[str, list[str]] = {}
+    for directory in path_env.split(os.pathsep):
+        if not directory:
+            continue
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name.lower() if windows else entry.name
+                    index.setdefault(name, []).append(entry.path)
+                    if windows:
+                        stem, ext = os.path.splitext(name)
+                        if ext in exts:
+                            index.setdefault(stem, []).append(entry.path)
+        except OSError:
+            continue
+    return {name: tuple(paths) for name, paths in index.items()}
+
+
+# lru_cache does not stop concurrent callers from each building the index on a miss
+_PATH_INDEX_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _which_on_path(tool: str, path_env: str) -> str | None:
+    key = tool.lower() if os.name == "nt" else tool
+    with _PATH_INDEX_LOCK:
+        index = _path_index(path_env)
+    for candidate in index.get(key, ()):
+        if os.access(candidate, os.X_OK) and not os.path.isdir(candidate):
+            return candidate
+    return None
+
+
+def _which(tool: str) -> str | None:
+    """shutil.which equivalent answered from the cached PATH index, memoized per tool and PATH."""
+    if os.path.dirname(tool):
+        return shutil.which(tool)
+    return _which_on_path(tool, os.environ.get("PATH", os.defpath))
+
+
+@functools.lru_cache(maxsize=1)
+def _has_claude_local() -> bool:
+    """Whether the migrate-installer Claude CLI exists as a regular file (one stat, cached per run)."""
+    try:
+        return stat.S_ISREG(os.stat(CLAUDE_LOCAL_PATH).st_mode)
+    except OSError:
+        return False
+
+
 def check_tool_for_tracker(tool: str, tracker: StepTracker) -> bool:
     """Check if a tool is installed and update tracker."""
-    if shutil.which(tool):
+    if _which(tool):
         tracker.complete(tool, "available")
         return True
     else:
@@ -474,13 +696,10 @@ def check_tool(tool: str, install_hint: str) -> bool:
     # and creates an alias at ~/.claude/local/claude instead
     # This path should be prioritized over other claude executables in PATH
     if tool == "claude":
-        if CLAUDE_LOCAL_PATH.exists() and CLAUDE_LOCAL_PATH.is_file():
+        if _has_claude_local():
             return True
-    
-    if shutil.which(tool):
-        return True
-    else:
-        return False
+
+    return _which(tool) is not None
 
 
 def is_git_repo(path: Path = None) -> bool:
@@ -509,13 +728,17 @@ def init_git_repo(project_path: Path, quiet: bool = False) -> bool:
     quiet: if True suppress console output (tracker handles status)
     """
     try:
-        original_cwd = Path.cwd()
-        os.chdir(project_path)
         if not quiet:
             console.print("[cyan]Initializing git repository...[/cyan]")
-        subprocess.run(["git", "init"], check=True, capture_output=True)
-        subprocess.run(["git", "add", "."], check=True, capture_output=True)
-        subprocess.run(["git", "commit", "-m", "Initial commit from Specify template"], check=True, capture_output=True)
+        # cwd= keeps the process working directory untouched (safe alongside concurrent work)
+        subprocess.run(["git", "init"], check=True, capture_output=True, cwd=project_path)
+        subprocess.run(["git", "add", "."], check=True, capture_output=True, cwd=project_path)
+        subprocess.run(
+            ["git", "commit", "-m", "Initial commit from Specify template"],
+            check=True,
+            capture_output=True,
+            cwd=project_path,
+        )
         if not quiet:
             console.print("[green]✓[/green] Git repository initialized")
         return True
@@ -524,8 +747,142 @@ def init_git_repo(project_path: Path, quiet: bool = False) -> bool:
         if not quiet:
             console.print(f"[red]Error initializing git repository:[/red] {e}")
         return False
-    finally:
-        os.chdir(original_cwd)
+
+
+def _release_api_url(repo_owner: str, repo_name: str) -> str:
+    return f"https://api.github.com/repos/{repo_owner}/{repo_name}/releases/latest"
+
+
+def _release_cache_path() -> Path:
+    import platformdirs
+
+    return Path(platformdirs.user_cache_dir("specify-cli")) / "releases.json"
+
+
+def _load_release_cache() -> dict:
+    """Return the on-disk {"owner/repo": {"etag", "data"}} release cache (empty when unreadable)."""
+    try:
+        cache = json.loads(_release_cache_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _store_release_cache(cache_key: str, etag: str | None, release_data: dict) -> None:
+    """Remember release_data under its ETag; cache write failures are never fatal."""
+    if not etag:
+        return
+    cache = _load_release_cache()
+    cache[cache_key] = {"etag": etag, "data": release_data}
+    cache_path = _release_cache_path()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(cache), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def _release_request_headers(cache_key: str, github_token: str | None) -> tuple[dict, dict | None]:
+    """Return (headers, cached entry) for a conditional latest-release request."""
+    headers = _github_auth_headers(github_token)
+    cached = _load_release_cache().get(cache_key)
+    if not isinstance(cached, dict) or not cached.get("etag") or "data" not in cached:
+        return headers, None
+    headers["If-None-Match"] = cached["etag"]
+    return headers, cached
+
+
+def _slim_release(release_data: dict) -> dict:
+    """Keep only what the CLI reads from a release: its tag and each asset's name, size, and URL."""
+    slim = {
+        "assets": [
+            {key: asset[key] for key in ("name", "size", "browser_download_url") if key in asset}
+            for asset in release_data.get("assets", [])
+        ],
+    }
+    if "tag_name" in release_data:
+        slim["tag_name"] = release_data["tag_name"]
+    return slim
+
+
+def _body_sample(response: "httpx.Response", limit: int) -> str:
+    """Decode only the leading bytes of a response body shown in error messages."""
+    return response.content[:limit].decode("utf-8", errors="replace")
+
+
+def _raise_for_download(response: "httpx.Response") -> None:
+    """Raise with status, headers and a body sample unless the asset response is a 200; the body must already be read."""
+    if response.status_code != 200:
+        body_sample = _body_sample(response, 400)
+        raise RuntimeError(f"Download failed with {response.status_code}\nHeaders: {response.headers}\nBody (truncated): {body_sample}")
+
+
+@contextmanager
+def _download_target(zip_path: Path, sink: BinaryIO | None):
+    """Yield sink, or zip_path opened for writing; a zip_path left incomplete by an error is removed."""
+    if sink is not None:
+        yield sink
+        return
+    try:
+        with open(zip_path, "wb") as f:
+            yield f
+    except BaseException:
+        zip_path.unlink(missing_ok=True)
+        raise
+
+
+def _parse_release_response(
+    response: "httpx.Response",
+    api_url: str,
+    debug: bool = False,
+    *,
+    cache_key: str | None = None,
+    cached: dict | None = None,
+) -> dict:
+    """Validate a GitHub releases API response and return the release tag and asset index.
+
+    A 304 reply to an If-None-Match request reuses the cached release data; a fresh
+    200 reply is written back to the cache when cache_key is given.
+    """
+    status = response.status_code
+    if status == 304 and cached is not None:
+        return cached["data"]
+    if status != 200:
+        msg = f"GitHub API returned {status} for {api_url}"
+        if debug:
+            msg += f"\nResponse headers: {response.headers}\nBody (truncated 500): {_body_sample(response, 500)}"
+        raise RuntimeError(msg)
+    try:
+        release_data = response.json()
+    except ValueError as je:
+        raise RuntimeError(f"Failed to parse release JSON: {je}\nRaw (truncated 400): {_body_sample(response, 400)}")
+    if not isinstance(release_data, dict):
+        raise RuntimeError(f"Unexpected release JSON payload\nRaw (truncated 400): {_body_sample(response, 400)}")
+    release_data = _slim_release(release_data)
+    if cache_key:
+        _store_release_cache(cache_key, response.headers.get("ETag"), release_data)
+    return release_data
+
+
+def _select_release_asset(release_data: dict, ai_assistant: str, script_type: str) -> dict:
+    """Find the template asset for the specified AI assistant, exiting when the release has none."""
+    assets = release_data.get("assets", [])
+    pattern = f"spec-kit-template-{ai_assistant}-{script_type}"
+    matching_assets = [
+        asset for asset in assets
+        if pattern in asset["name"] and asset["name"].endswith(".zip")
+    ]
+
+    asset = matching_assets[0] if matching_assets else None
+
+    if asset is None:
+        console.print(f"[red]No matching release asset found[/red] for [bold]{ai_assistant}[/bold] (expected pattern: [bold]{pattern}[/bold])")
+        asset_names = [a.get('name', '?') for a in assets]
+        console.print(Panel("\n".join(asset_names) or "(no assets)", title="Available Assets", border_style="yellow"))
+        raise typer.Exit(1)
+    return asset
 
 
 def download_template_from_github(
@@ -535,57 +892,39 @@ def download_template_from_github(
     script_type: str = "sh",
     verbose: bool = True,
     show_progress: bool = True,
-    client: httpx.Client = None,
+    client: "httpx.Client | None" = None,
     debug: bool = False,
     github_token: str = None,
     repo_owner: str = "github",
     repo_name: str = "spec-kit",
-) -> Tuple[Path, dict]:
-    if client is None:
-        client = httpx.Client(verify=ssl_context)
-    
+    sink: BinaryIO | None = None,
+) -> Tuple[Path | None, dict]:
+    """Download the agent's template asset from the latest release.
+
+    The archive is written to download_dir, or into sink when one is given; in that
+    case no file is created and the returned path is None.
+    """
+    client = client or _get_client()
+
     if verbose:
         console.print("[cyan]Fetching latest release information...[/cyan]")
-    api_url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/releases/latest"
-    
+    api_url = _release_api_url(repo_owner, repo_name)
+    cache_key = f"{repo_owner}/{repo_name}"
     try:
+        headers, cached = _release_request_headers(cache_key, github_token)
         response = client.get(
             api_url,
             timeout=30,
             follow_redirects=True,
-            headers=_github_auth_headers(github_token),
+            headers=headers,
         )
-        status = response.status_code
-        if status != 200:
-            msg = f"GitHub API returned {status} for {api_url}"
-            if debug:
-                msg += f"\nResponse headers: {response.headers}\nBody (truncated 500): {response.text[:500]}"
-            raise RuntimeError(msg)
-        try:
-            release_data = response.json()
-        except ValueError as je:
-            raise RuntimeError(f"Failed to parse release JSON: {je}\nRaw (truncated 400): {response.text[:400]}")
+        release_data = _parse_release_response(response, api_url, debug, cache_key=cache_key, cached=cached)
     except Exception as e:
         console.print(f"[red]Error fetching release information[/red]")
         console.print(Panel(str(e), title="Fetch Error", border_style="red"))
         raise typer.Exit(1)
     
-    # Find the template asset for the specified AI assistant
-    assets = release_data.get("assets", [])
-    pattern = f"spec-kit-template-{ai_assistant}-{script_type}"
-    matching_assets = [
-        asset for asset in assets
-        if pattern in asset["name"] and asset["name"].endswith(".zip")
-    ]
-
-    asset = matching_assets[0] if matching_assets else None
-
-    if asset is None:
-        console.print(f"[red]No matching release asset found[/red] for [bold]{ai_assistant}[/bold] (expected pattern: [bold]{pattern}[/bold])")
-        asset_names = [a.get('name', '?') for a in assets]
-        console.print(Panel("\n".join(asset_names) or "(no assets)", title="Available Assets", border_style="yellow"))
-        raise typer.Exit(1)
-
+    asset = _select_release_asset(release_data, ai_assistant, script_type)
     download_url = asset["browser_download_url"]
     filename = asset["name"]
     file_size = asset["size"]
@@ -608,15 +947,17 @@ def download_template_from_github(
             headers=_github_auth_headers(github_token),
         ) as response:
             if response.status_code != 200:
-                body_sample = response.text[:400]
-                raise RuntimeError(f"Download failed with {response.status_code}\nHeaders: {response.headers}\nBody (truncated): {body_sample}")
+                response.read()
+                _raise_for_download(response)
             total_size = int(response.headers.get('content-length', 0))
-            with open(zip_path, 'wb') as f:
+            with _download_target(zip_path, sink) as f:
                 if total_size == 0:
                     for chunk in response.iter_bytes(chunk_size=8192):
                         f.write(chunk)
                 else:
                     if show_progress:
+                        from rich.progress import Progress, SpinnerColumn, TextColumn
+
                         with Progress(
                             SpinnerColumn(),
                             TextColumn("[progress.description]{task.description}"),
@@ -635,8 +976,6 @@ def download_template_from_github(
     except Exception as e:
         console.print(f"[red]Error downloading template[/red]")
         detail = str(e)
-        if zip_path.exists():
-            zip_path.unlink()
         console.print(Panel(detail, title="Download Error", border_style="red"))
         raise typer.Exit(1)
     if verbose:
@@ -647,9 +986,248 @@ def download_template_from_github(
         "release": release_data["tag_name"],
         "asset_url": download_url
     }
+    return (None if sink is not None else zip_path), metadata
+
+
+async def _download_template_async(
+    ai_assistant: str,
+    download_dir: Path,
+    release_data: dict,
+    client: "httpx.AsyncClient",
+    *,
+    script_type: str = "sh",
+    github_token: str = None,
+    progress: "Progress | None" = None,
+    sink: BinaryIO | None = None,
+) -> Tuple[Path | BinaryIO, dict]:
+    """Stream one agent's release asset to download_dir (or sink); the async twin of download_template_from_github."""
+    asset = _select_release_asset(release_data, ai_assistant, script_type)
+    download_url = asset["browser_download_url"]
+    filename = asset["name"]
+    zip_path = download_dir / filename
+
+    async with client.stream(
+        "GET",
+        download_url,
+        timeout=60,
+        follow_redirects=True,
+        headers=_github_auth_headers(github_token),
+    ) as response:
+        if response.status_code != 200:
+            await response.aread()
+            _raise_for_download(response)
+        total_size = int(response.headers.get('content-length', 0))
+        task = progress.add_task(filename, total=total_size or None) if progress else None
+        with _download_target(zip_path, sink) as f:
+            async for chunk in response.aiter_bytes(chunk_size=8192):
+                f.write(chunk)
+                if task is not None:
+                    progress.advance(task, len(chunk))
+
+    metadata = {
+        "filename": filename,
+        "size": asset["size"],
+        "release": release_data["tag_name"],
+        "asset_url": download_url
+    }
+    if sink is not None:
+        sink.seek(0)
+        return sink, metadata
     return zip_path, metadata
 
 
+def download_templates_from_github(
+    ai_assistants: Sequence[str],
+    download_dir: Path,
+    *,
+    script_type: str = "sh",
+    show_progress: bool = True,
+    verify: "ssl.SSLContext | bool" = True,
+    debug: bool = False,
+    github_token: str = None,
+    repo_owner: str = "github",
+    repo_name: str = "spec-kit",
+    in_memory: bool = False,
+) -> List[Tuple[Path | BinaryIO, dict]]:
+    """Download the release assets for several agents concurrently.
+
+    The latest-release metadata is fetched once and every asset is streamed over a
+    single HTTP/2 connection pool, so total wall time tracks the slowest asset rather
+    than the sum of all of them. Results are returned in the order of ai_assistants;
+    with in_memory=True each archive is a rewound spooled buffer instead of a file in
+    download_dir.
+    """
+    import asyncio
+
+    import httpx
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    if verify is True:
+        verify = _get_ssl_context()
+    api_url = _release_api_url(repo_owner, repo_name)
+    cache_key = f"{repo_owner}/{repo_name}"
+    sinks = [
+        tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) if in_memory else None
+        for _ in ai_assistants
+    ]
+
+    async def _run(progress: "Progress | None") -> list:
+        async with httpx.AsyncClient(
+            http2=True,
+            verify=verify,
+            limits=httpx.Limits(max_connections=max(2, len(ai_assistants) * 2)),
+            timeout=httpx.Timeout(30.0, connect=10.0),
+        ) as async_client:
+            try:
+                headers, cached = _release_request_headers(cache_key, github_token)
+                response = await async_client.get(
+                    api_url,
+                    timeout=30,
+                    follow_redirects=True,
+                    headers=headers,
+                )
+                release_data = _parse_release_response(response, api_url, debug, cache_key=cache_key, cached=cached)
+            except Exception as e:
+                console.print("[red]Error fetching release information[/red]")
+                console.print(Panel(str(e), title="Fetch Error", border_style="red"))
+                raise typer.Exit(1)
+            return await asyncio.gather(
+                *(
+                    _download_template_async(
+                        ai_assistant,
+                        download_dir,
+                        release_data,
+                        async_client,
+                        script_type=script_type,
+                        github_token=github_token,
+                        progress=progress,
+                        sink=sink,
+                    )
+                    for ai_assistant, sink in zip(ai_assistants, sinks)
+                ),
+                return_exceptions=True,
+            )
+
+    try:
+        if show_progress:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                console=console,
+            ) as progress:
+                results = asyncio.run(_run(progress))
+        else:
+            results = asyncio.run(_run(None))
+    except BaseException:
+        for sink in sinks:
+            if sink is not None:
+                sink.close()
+        raise
+
+    failures = [result for result in results if isinstance(result, BaseException)]
+    if failures:
+        # Drop the archives that did arrive so a failed run leaves nothing behind
+        for sink in sinks:
+            if sink is not None:
+                sink.close()
+        for result in results:
+            if not isinstance(result, BaseException) and isinstance(result[0], Path) and result[0].exists():
+                result[0].unlink()
+        if isinstance(failures[0], typer.Exit):
+            raise failures[0]
+        console.print("[red]Error downloading template[/red]")
+        console.print(Panel(str(failures[0]), title="Download Error", border_style="red"))
+        raise typer.Exit(1)
+    return results
+
+
+def _fast_copy(src: str | Path, dst: str | Path) -> str | Path:
+    """Copy file contents and metadata like shutil.copy2, using os.copy_file_range where available."""
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is None:
+        return shutil.copy2(src, dst)
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            while copy_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                pass
+        except OSError:
+            # Unsupported for this pair of files (e.g. cross-filesystem on older kernels)
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst, 1024 * 1024)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _member_parts(name: str) -> list[str]:
+    """Split an archive member name into path components, sanitized exactly as ZipFile.extract does."""
+    name = name.replace("/", os.sep)
+    if os.altsep:
+        name = name.replace(os.altsep, os.sep)
+    # Absolute names become relative: drive letters, UNC roots, '.' and '..' are dropped
+    name = os.path.splitdrive(name)[1]
+    name = os.sep.join(part for part in name.split(os.sep) if part not in ("", os.curdir, os.pardir))
+    if os.sep == "\\":
+        # Replaces ':' and other characters Windows rejects, so no component can carry a drive
+        name = zipfile.ZipFile._sanitize_windows_name(name, os.sep)
+    return name.split(os.sep) if name else []
+
+
+def _extract_zip_members(
+    zip_ref: zipfile.ZipFile,
+    dest_root: Path,
+    prefix: str = "",
+    *,
+    include_top_level: set[str] | None = None,
+    keep_existing_under: str | None = None,
+) -> set[str]:
+    """Extract members under include_top_level into dest_root with prefix stripped, keeping existing files below keep_existing_under.
+
+    Returns every top-level name in the archive, including filtered-out ones.
+    """
+    made_dirs = {dest_root}
+    top_level: set[str] = set()
+    files: List[Tuple[zipfile.ZipInfo, Path]] = []
+    for info in zip_ref.infolist():
+        parts = _member_parts(info.filename[len(prefix):])
+        if not parts:
+            continue
+        top_level.add(parts[0])
+        if include_top_level is not None and parts[0] not in include_top_level:
+            continue
+        dest = dest_root.joinpath(*parts)
+        parent = dest if info.is_dir() else dest.parent
+        if parent not in made_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            made_dirs.add(parent)
+        if info.is_dir():
+            continue
+        if parts[0] == keep_existing_under and os.path.exists(dest):
+            continue
+        files.append((info, dest))
+
+    def _write_member(member: Tuple[zipfile.ZipInfo, Path]) -> None:
+        info, dest = member
+        with zip_ref.open(info) as src, open(dest, "wb") as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+
+    workers = min(len(files), os.cpu_count() or 1)
+    if len(files) < _PARALLEL_EXTRACT_MIN_MEMBERS or workers < 2:
+        for member in files:
+            _write_member(member)
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        # ZipFile.open hands every reader its own view of the archive and serializes the
+        # underlying seeks/reads with an internal lock, so workers can share zip_ref;
+        # zlib releases the GIL while inflating.
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_write_member, files))
+    return top_level
+
+
 def download_and_extract_template(
     project_path: Path,
     ai_assistant: str,
@@ -658,7 +1236,7 @@ def download_and_extract_template(
     *,
     verbose: bool = True,
     tracker: StepTracker | None = None,
-    client: httpx.Client = None,
+    client: "httpx.Client | None" = None,
     debug: bool = False,
     github_token: str = None,
     template_repo: Tuple[str, str] | None = None,
@@ -666,14 +1244,25 @@ def download_and_extract_template(
     tracker_agent_label: str | None = None,
     top_level_filter: Sequence[str] | None = None,
     preserve_existing_specs: bool = False,
+    prefetched: Tuple[Path | BinaryIO, dict] | None = None,
 ) -> Path:
-    """Provision project scaffolding from a release archive or local template."""
+    """Provision project scaffolding from a release archive or local template.
+
+    prefetched: an already-downloaded (archive, metadata) pair, as returned by
+    download_templates_from_github; the archive is removed or closed after extraction.
+
+    Downloaded archives are spooled in memory and extracted from there; with debug the
+    archive is written to the working directory and kept there for inspection.
+
+    On failure the partially populated project_path is left for the caller to discard
+    (init builds new projects in a separate directory and removes that instead).
+    """
     current_dir = Path.cwd()
     repo_owner, repo_name = template_repo or ("github", "spec-kit")
 
     local_template_dir: Path | None = None
     zip_path: Path | None = None
-    temp_dir_ctx: tempfile.TemporaryDirectory | None = None
+    spooled: BinaryIO | None = None
     meta: dict = {}
     cleanup_zip = False
     using_local_template = template_path is not None
@@ -683,8 +1272,8 @@ def download_and_extract_template(
         for value in top_level_filter:
             if not value:
                 continue
-            parts = Path(value).parts
-            filtered_top_level.add(parts[0] if parts else value)
+            head = value.replace("\\", "/").split("/", 1)[0]
+            filtered_top_level.add(head or value)
         if not filtered_top_level:
             filtered_top_level = None
 
@@ -735,9 +1324,21 @@ def download_and_extract_template(
                 tracker.complete("download", _tag(zip_path.name))
             elif verbose:
                 console.print(f"[cyan]Using local template archive:[/cyan] {zip_path}")
+    elif prefetched is not None:
+        archive, meta = prefetched
+        if isinstance(archive, Path):
+            zip_path = archive
+            cleanup_zip = not debug
+        else:
+            spooled = archive
+        if tracker:
+            tracker.complete("fetch", _tag(f"release {meta['release']} ({meta['size']:,} bytes)"))
+            tracker.complete("download", _tag(meta['filename']))
     else:
         if tracker:
             tracker.start("fetch", _tag("contacting GitHub API"))
+        if not debug:
+            spooled = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE)
         try:
             zip_path, meta = download_template_from_github(
                 ai_assistant,
@@ -750,12 +1351,19 @@ def download_and_extract_template(
                 github_token=github_token,
                 repo_owner=repo_owner,
                 repo_name=repo_name,
+                sink=spooled,
             )
-            cleanup_zip = True
+            if spooled is not None:
+                meta["size"] = spooled.tell()
+                spooled.seek(0)
+            else:
+                cleanup_zip = not debug
             if tracker:
                 tracker.complete("fetch", _tag(f"release {meta['release']} ({meta['size']:,} bytes)"))
                 tracker.complete("download", _tag(meta['filename']))
         except Exception as e:
+            if spooled is not None:
+                spooled.close()
             if tracker:
                 tracker.error("fetch", _tag(str(e)))
             else:
@@ -772,18 +1380,29 @@ def download_and_extract_template(
     def _copytree_preserve(src: Path, dest: Path) -> None:
         """Copy directory contents but skip files that already exist at destination."""
         if not dest.exists():
-            shutil.copytree(src, dest)
+            shutil.copytree(src, dest, copy_function=_fast_copy)
             return
-        dest.mkdir(parents=True, exist_ok=True)
-        for child in src.iterdir():
-            target = dest / child.name
-            if child.is_dir():
-                _copytree_preserve(child, target)
-            else:
-                if target.exists():
-                    continue
-                target.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(child, target)
+        # (source dir, destination dir, destination freshly created) - nothing in a fresh dir needs an existence probe
+        stack = [(os.fspath(src), os.fspath(dest), False)]
+        while stack:
+            src_dir, dest_dir, fresh = stack.pop()
+            with os.scandir(src_dir) as entries:
+                for entry in entries:
+                    target = os.path.join(dest_dir, entry.name)
+                    if entry.is_dir():
+                        try:
+                            os.mkdir(target)
+                            stack.append((entry.path, target, True))
+                        except FileExistsError:
+                            stack.append((entry.path, target, False))
+                        continue
+                    if not fresh:
+                        try:
+                            os.stat(target)
+                            continue
+                        except FileNotFoundError:
+                            pass
+                    _fast_copy(entry.path, target)
 
     def _merge_into_project(payload_root: Path) -> None:
         resolved_project_path = project_path.resolve()
@@ -804,10 +1423,30 @@ def download_and_extract_template(
                 continue
 
             if item.is_dir():
-                shutil.copytree(item, dest_path, dirs_exist_ok=True)
+                shutil.copytree(item, dest_path, dirs_exist_ok=True, copy_function=_fast_copy)
             else:
                 dest_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(item, dest_path)
+                _fast_copy(item, dest_path)
+
+    def _extract_into_project(zip_ref: zipfile.ZipFile) -> Tuple[bool, int]:
+        """Stream archive members straight to their project paths. Returns (flattened, payload item count).
+
+        Applies the same top-level filter and .specs preservation as _merge_into_project.
+        """
+        names = zip_ref.namelist()
+        top_names = {name.split("/", 1)[0] for name in names}
+        prefix = ""
+        if len(top_names) == 1 and any("/" in name for name in names):
+            # Single top-level directory: same flattening the staged path applies
+            prefix = next(iter(top_names)) + "/"
+        payload_items = _extract_zip_members(
+            zip_ref,
+            project_path.resolve(),
+            prefix,
+            include_top_level=filtered_top_level,
+            keep_existing_under=".specs" if preserve_existing_specs else None,
+        )
+        return bool(prefix), len(payload_items)
 
     try:
         if not is_current_dir:
@@ -816,6 +1455,9 @@ def download_and_extract_template(
         if tracker and local_template_dir is None:
             tracker.add("zip-list", "Archive contents")
 
+        payload_root: Optional[Path] = None
+        payload_count = 0
+        flatten_applied = False
         if local_template_dir is not None:
             extracted_items = list(local_template_dir.iterdir())
             if tracker:
@@ -823,21 +1465,17 @@ def download_and_extract_template(
                 tracker.complete("zip-list", _tag(f"{len(extracted_items)} items"))
             payload_root = local_template_dir
         else:
-            temp_dir_ctx = tempfile.TemporaryDirectory()
-            temp_dir = Path(temp_dir_ctx.name)
-            with zipfile.ZipFile(zip_path, "r") as zip_ref:
+            with zipfile.ZipFile(spooled if spooled is not None else zip_path, "r") as zip_ref:
                 zip_contents = zip_ref.namelist()
                 if tracker:
                     tracker.start("zip-list", _tag("listing"))
                     tracker.complete("zip-list", _tag(f"{len(zip_contents)} entries"))
                 elif verbose:
                     console.print(f"[cyan]ZIP contains {len(zip_contents)} items[/cyan]")
-                zip_ref.extractall(temp_dir)
-            extracted_items = list(temp_dir.iterdir())
-            payload_root = temp_dir
+                # Members are written straight to their final paths; no temp directory staging
+                flatten_applied, payload_count = _extract_into_project(zip_ref)
 
-        flatten_applied = False
-        if len(extracted_items) == 1 and extracted_items[0].is_dir():
+        if payload_root is not None and len(extracted_items) == 1 and extracted_items[0].is_dir():
             payload_root = extracted_items[0]
             flatten_applied = True
 
@@ -848,11 +1486,13 @@ def download_and_extract_template(
             elif verbose:
                 console.print("[cyan]Flattened nested directory structure[/cyan]")
 
-        _merge_into_project(payload_root)
+        if payload_root is not None:
+            _merge_into_project(payload_root)
+            payload_count = len(os.listdir(payload_root))
 
         if tracker:
             tracker.start("extracted-summary", _tag("summarizing"))
-            tracker.complete("extracted-summary", _tag(f"{len(list(payload_root.iterdir()))} payload items"))
+            tracker.complete("extracted-summary", _tag(f"{payload_count} payload items"))
         elif verbose:
             console.print(f"[cyan]Template files copied to {project_path}[/cyan]")
 
@@ -864,17 +1504,16 @@ def download_and_extract_template(
                 console.print(f"[red]Error extracting template:[/red] {e}")
                 if debug:
                     console.print(Panel(str(e), title="Extraction Error", border_style="red"))
-        if not is_current_dir and project_path.exists():
-            shutil.rmtree(project_path)
         raise typer.Exit(1)
     else:
         if tracker:
             tracker.complete("extract", _tag("done"))
     finally:
-        if temp_dir_ctx is not None:
-            temp_dir_ctx.cleanup()
-
-        if cleanup_zip and zip_path and zip_path.exists():
+        if spooled is not None:
+            spooled.close()
+            if tracker:
+                tracker.complete("cleanup", _tag("Released downloaded archive"))
+        elif cleanup_zip and zip_path and zip_path.exists():
             zip_path.unlink()
             if tracker:
                 tracker.complete("cleanup", _tag("Removed downloaded archive"))
@@ -883,10 +1522,46 @@ def download_and_extract_template(
         elif using_local_template:
             if tracker:
                 tracker.skip("cleanup", _tag("Local template retained"))
+        elif debug and zip_path is not None:
+            if tracker:
+                tracker.skip("cleanup", _tag(f"Archive kept at {zip_path}"))
+            elif verbose:
+                console.print(f"[cyan]Archive kept at:[/cyan] {zip_path}")
 
     return project_path
 
 
+def _iter_shell_scripts(root: Path):
+    """Yield DirEntry objects for regular (non-symlink) *.sh files under root; symlinked dirs are not followed."""
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".sh") and entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError:
+            continue
+
+
+def _shebang_mode(path: str) -> int | None:
+    """Return the st_mode of path if it starts with '#!', else None.
+
+    Raw os.open/os.read (no buffered file object); the mode comes from fstat on the same
+    descriptor, so the path is resolved once. O_NONBLOCK keeps a FIFO from stalling the walk.
+    """
+    flags = os.O_RDONLY | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_NONBLOCK", 0)
+    fd = os.open(path, flags)
+    try:
+        if os.read(fd, 2) != b"#!":
+            return None
+        return os.fstat(fd).st_mode
+    finally:
+        os.close(fd)
+
+
 def ensure_executable_scripts(project_path: Path, tracker: StepTracker | None = None) -> None:
     """Ensure POSIX .sh scripts under .specs/.specify/scripts (recursively) have execute bits (no-op on Windows)."""
     if os.name == "nt":
@@ -895,30 +1570,37 @@ def ensure_executable_scripts(project_path: Path, tracker: StepTracker | None =
     if not scripts_root.is_dir():
         return
     failures: list[str] = []
-    updated = 0
-    for script in scripts_root.rglob("*.sh"):
+    pending: list[tuple[str, int]] = []
+    for script in _iter_shell_scripts(scripts_root):
         try:
-            if script.is_symlink() or not script.is_file():
-                continue
-            try:
-                with script.open("rb") as f:
-                    if f.read(2) != b"#!":
-                        continue
-            except Exception:
-                continue
-            st = script.stat(); mode = st.st_mode
-            if mode & 0o111:
-                continue
-            new_mode = mode
-            if mode & 0o400: new_mode |= 0o100
-            if mode & 0o040: new_mode |= 0o010
-            if mode & 0o004: new_mode |= 0o001
-            if not (new_mode & 0o100):
-                new_mode |= 0o100
-            os.chmod(script, new_mode)
-            updated += 1
+            mode = _shebang_mode(script.path)
+        except OSError:
+            continue
+        if mode is None:
+            continue
+        if mode & 0o111:
+            continue
+        # Each read bit grants the matching execute bit; owner execute is always set
+        pending.append((script.path, mode | ((mode & 0o444) >> 2) | 0o100))
+
+    def _apply(item: tuple[str, int]) -> str | None:
+        path, new_mode = item
+        try:
+            os.chmod(path, new_mode)
         except Exception as e:
-            failures.append(f"{script.relative_to(scripts_root)}: {e}")
+            return f"{Path(path).relative_to(scripts_root)}: {e}"
+        return None
+
+    if len(pending) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        # os.chmod releases the GIL, so the syscalls overlap
+        with ThreadPoolExecutor(max_workers=min(len(pending), 4)) as pool:
+            results = list(pool.map(_apply, pending))
+    else:
+        results = [_apply(item) for item in pending]
+    failures.extend(r for r in results if r is not None)
+    updated = len(pending) - len(failures)
     if tracker:
         detail = f"{updated} updated" + (f", {len(failures)} failed" if failures else "")
         tracker.add("chmod", "Set script permissions recursively")
@@ -932,75 +1614,114 @@ def ensure_executable_scripts(project_path: Path, tracker: StepTracker | None =
                 console.print(f"  - {f}")
 
 
+def _fast_move(src: Path, dst: Path) -> None:
+    """Rename src to dst (which must be free), falling back to shutil.move across filesystems."""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dst))
+
+
+def _rename_into_place(src: Path, dst: Path, attempts: int = 5) -> None:
+    """Rename src to dst, retrying briefly while another process (e.g. a Windows virus scanner) holds it open."""
+    for attempt in range(1, attempts + 1):
+        try:
+            os.rename(src, dst)
+            return
+        except PermissionError:
+            if attempt == attempts:
+                raise
+            time.sleep(0.1 * attempt)
+
+
+# Project-root directories that belong under .specs/.specify rather than beside the agent folders
+_NON_AGENT_DIRS = ("plan", "spec", "notes", "scratch", "memory", "docs", "logs", "specs")
+
+
+def _entry_names(directory: Path) -> set[str]:
+    """Casefolded names directly inside directory from one listing (empty if it cannot be read)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name.casefold() for entry in entries}
+    except OSError:
+        return set()
+
+
 def relocate_non_agent_directories(project_path: Path, tracker: StepTracker | None = None) -> None:
     """Move legacy non-agent directories into the consolidated .specs/.specify/ root."""
     specs_root = get_specs_root(project_path)
     specify_root = get_specify_root(project_path)
+    # One listing of the destination rules out most "already there?" checks below. Names are
+    # compared casefolded and confirmed with exists(), which follows the filesystem's own case rules
+    specify_names = _entry_names(specify_root)
 
     # Migrate from legacy .specify directory if present
     legacy_root = project_path / ".specify"
     migrated = 0
     if legacy_root.is_dir():
-        for item in legacy_root.iterdir():
-            dest = specify_root / item.name
-            if dest.exists():
-                if item.is_dir():
+        with os.scandir(legacy_root) as entries:
+            legacy_entries = list(entries)
+        for entry in legacy_entries:
+            item = Path(entry.path)
+            dest = specify_root / entry.name
+            if entry.name.casefold() in specify_names and dest.exists():
+                if entry.is_dir():
                     dest.mkdir(parents=True, exist_ok=True)
+                    existing = _entry_names(dest)
                     for child in item.iterdir():
                         target = dest / child.name
-                        if target.exists():
+                        if child.name.casefold() in existing and target.exists():
                             continue
-                        shutil.move(str(child), str(target))
+                        _fast_move(child, target)
                 else:
                     continue
             else:
-                shutil.move(str(item), str(dest))
+                _fast_move(item, dest)
+                specify_names.add(entry.name.casefold())
             migrated += 1
         try:
             legacy_root.rmdir()
         except OSError:
             pass
 
-    non_agent_dirs = [
-        "plan",
-        "spec",
-        "notes",
-        "scratch",
-        "memory",
-        "docs",
-        "logs",
-        "specs",
-    ]
-
     moved = 0
-    for name in non_agent_dirs:
+    present = _entry_names(project_path)
+    for name in _NON_AGENT_DIRS:
+        if name not in present:
+            continue
         source = project_path / name
         if not source.exists():
             continue
         destination = specify_root / name
-        if destination.exists():
+        if name in specify_names and destination.exists():
             continue
-        shutil.move(str(source), str(destination))
+        _fast_move(source, destination)
+        specify_names.add(name)
         moved += 1
 
     nested_moved = 0
-    for item in specs_root.iterdir():
-        if item.name == ".specify":
-            continue
-        dest = specify_root / item.name
+    with os.scandir(specs_root) as entries:
+        nested_entries = [entry for entry in entries if entry.name != ".specify"]
+    for entry in nested_entries:
+        item = Path(entry.path)
+        dest = specify_root / entry.name
         try:
-            if dest.exists():
-                if item.is_dir() and dest.is_dir():
+            if entry.name.casefold() in specify_names and dest.exists():
+                if entry.is_dir() and dest.is_dir():
+                    existing = _entry_names(dest)
                     for child in item.iterdir():
                         target = dest / child.name
-                        if target.exists():
+                        if child.name.casefold() in existing and target.exists():
                             continue
-                        shutil.move(str(child), str(target))
+                        _fast_move(child, target)
                     item.rmdir()
                 else:
                     continue
             else:
-                shutil.move(str(item), str(dest))
+                _fast_move(item, dest)
+                specify_names.add(entry.name.casefold())
                 nested_moved += 1
         except Exception:
             continue
@@ -1092,9 +1813,10 @@ def init(
     if here:
         project_name = Path.cwd().name
         project_path = Path.cwd()
+        build_path = project_path
         
         # Check if current directory has any files
-        existing_items = list(project_path.iterdir())
+        existing_items = os.listdir(project_path)
         if existing_items:
             console.print(f"[yellow]Warning:[/yellow] Current directory is not empty ({len(existing_items)} items)")
             console.print("[yellow]Template files will be merged with existing content and may overwrite existing files[/yellow]")
@@ -1120,6 +1842,20 @@ def init(
             console.print()
             console.print(error_panel)
             raise typer.Exit(1)
+        # A new project is assembled beside its final location and renamed into place once
+        # complete, so a failed run only ever removes this partial directory
+        build_path = project_path.with_name(f".{project_path.name}.partial")
+        if build_path.exists():
+            error_panel = Panel(
+                f"Build directory '[cyan]{build_path.name}[/cyan]' already exists\n"
+                "It may be left over from an interrupted run; remove it and try again.",
+                title="[red]Directory Conflict[/red]",
+                border_style="red",
+                padding=(1, 2)
+            )
+            console.print()
+            console.print(error_panel)
+            raise typer.Exit(1)
     
     # Create formatted setup info with column alignment
     current_dir = Path.cwd()
@@ -1156,7 +1892,7 @@ def init(
                 "copilot",
             )
             selected_ais = [selected_primary]
-            remaining = [key for key in AI_CHOICES if key not in selected_ais]
+            remaining = [key for key in AI_CHOICES if key != selected_primary]
             while remaining and typer.confirm("Add another AI assistant?", default=False):
                 next_choice = select_with_arrows(
                     {key: AI_CHOICES[key] for key in remaining},
@@ -1164,21 +1900,19 @@ def init(
                     remaining[0],
                 )
                 selected_ais.append(next_choice)
-                remaining = [key for key in AI_CHOICES if key not in selected_ais]
+                remaining.remove(next_choice)
         else:
             selected_ais = ["copilot"]
 
-    normalized_ais: List[str] = []
-    for ai_key in selected_ais:
-        if ai_key not in AI_CHOICES:
-            console.print(
-                f"[red]Error:[/red] Invalid AI assistant '{ai_key}'. Choose from: {', '.join(AI_CHOICES.keys())}"
-            )
-            raise typer.Exit(1)
-        if ai_key not in normalized_ais:
-            normalized_ais.append(ai_key)
+    invalid_ais = [ai_key for ai_key in selected_ais if ai_key not in AI_CHOICES]
+    if invalid_ais:
+        console.print(
+            f"[red]Error:[/red] Invalid AI assistant '{invalid_ais[0]}'. Choose from: {', '.join(AI_CHOICES.keys())}"
+        )
+        raise typer.Exit(1)
 
-    selected_ais = normalized_ais or ["copilot"]
+    # Drop repeats, keeping first-seen order
+    selected_ais = list(dict.fromkeys(selected_ais)) or ["copilot"]
     
     # Check agent tools unless ignored
     if not ignore_agent_tools:
@@ -1290,7 +2024,7 @@ def init(
     tracker.complete("ai-select", human_join(selected_agent_labels))
     tracker.add("script-select", "Select script type")
     tracker.complete("script-select", selected_script)
-    for key, label in [
+    tracker.add_many([
         ("fetch", "Fetch latest release"),
         ("download", "Download template"),
         ("extract", "Extract template"),
@@ -1301,37 +2035,64 @@ def init(
         ("cleanup", "Cleanup"),
         ("git", "Initialize git repository"),
         ("final", "Finalize")
-    ]:
-        tracker.add(key, label)
-
-    # Use transient so live tree is replaced by the final static render (avoids duplicate output)
-    with Live(tracker.render(), console=console, refresh_per_second=8, transient=True) as live:
-        tracker.attach_refresh(lambda: live.update(tracker.render()))
+    ])
+
+    prefetched: dict[str, Tuple[Path | BinaryIO, dict]] = {}
+    local_client = None
+    build_complete = False
+
+    # Per-agent merge settings, fixed before the live display starts. Later agents only add
+    # their own agent directory; an agent without one merges everything except existing .specs
+    existing_specs_present = here and (project_path / ".specs").exists()
+    plans: list[_AgentPlan] = []
+    for idx, ai_key in enumerate(selected_ais, start=1):
+        agent_root = AGENT_ROOT_NAMES.get(ai_key)
+        plans.append(_AgentPlan(
+            ai_key=ai_key,
+            top_level=[agent_root] if idx > 1 and agent_root else None,
+            preserve_specs=existing_specs_present if idx == 1 else not agent_root,
+            label=f"{AI_CHOICES[ai_key]} ({idx}/{len(selected_ais)})",
+        ))
+    from rich.live import Live
+
+    # Use transient so live tree is replaced by the final static render (avoids duplicate output).
+    # Live renders the tracker itself: step changes trigger a throttled refresh, and the slow
+    # auto-refresh picks up any update that landed inside the throttle window.
+    with Live(tracker, console=console, refresh_per_second=8, transient=True) as live:
+        tracker.attach_refresh(live.refresh)
         try:
-            # Create a httpx client with verify based on skip_tls
+            # Create a httpx client with verify based on skip_tls; either way one pooled HTTP/2
+            # client serves every agent's requests
             verify = not skip_tls
-            local_ssl_context = ssl_context if verify else False
-            local_client = httpx.Client(verify=local_ssl_context)
+            if verify:
+                local_client = _get_client()
+            else:
+                local_client = _new_client(False)
+
+            # Several remote agents: fetch all archives concurrently before extracting them in order
+            if template_path_value is None and len(selected_ais) > 1:
+                tracker.start("fetch", f"contacting GitHub API ({len(selected_ais)} agents)")
+                downloads = download_templates_from_github(
+                    selected_ais,
+                    current_dir,
+                    script_type=selected_script,
+                    show_progress=False,
+                    verify=verify,
+                    debug=debug,
+                    github_token=github_token,
+                    repo_owner=repo_owner,
+                    repo_name=repo_name,
+                    in_memory=not debug,
+                )
+                prefetched = dict(zip(selected_ais, downloads))
 
-            existing_specs_present = (project_path / ".specs").exists()
             completed_agents: list[str] = []
 
-            for idx, ai_key in enumerate(selected_ais, start=1):
-                agent_root = AGENT_ROOT_NAMES.get(ai_key)
-                top_level = None
-                if idx > 1 and agent_root:
-                    top_level = [agent_root]
-
-                preserve_specs = False
-                if idx == 1 and existing_specs_present:
-                    preserve_specs = True
-                elif idx > 1 and not agent_root:
-                    preserve_specs = True
-
-                agent_label = f"{AI_CHOICES[ai_key]} ({idx}/{len(selected_ais)})"
+            for plan in plans:
+                ai_key = plan.ai_key
 
                 download_and_extract_template(
-                    project_path,
+                    build_path,
                     ai_key,
                     selected_script,
                     here,
@@ -1342,32 +2103,31 @@ def init(
                     github_token=github_token,
                     template_repo=(repo_owner, repo_name),
                     template_path=template_path_value,
-                    tracker_agent_label=agent_label,
-                    top_level_filter=top_level,
-                    preserve_existing_specs=preserve_specs,
+                    tracker_agent_label=plan.label,
+                    top_level_filter=plan.top_level,
+                    preserve_existing_specs=plan.preserve_specs,
+                    prefetched=prefetched.pop(ai_key, None),
                 )
 
                 completed_agents.append(ai_key)
-                existing_specs_present = existing_specs_present or (project_path / ".specs").exists()
                 if tracker:
                     progress_note = f"{len(completed_agents)}/{len(selected_ais)} agents"
-                    for key in ("download", "extract", "zip-list", "extracted-summary"):
-                        tracker.complete(key, progress_note)
+                    tracker.complete_many(("download", "extract", "zip-list", "extracted-summary"), progress_note)
 
             # Consolidate non-agent assets under .specs/.specify
             tracker.start("relocate")
-            relocate_non_agent_directories(project_path, tracker=tracker)
+            relocate_non_agent_directories(build_path, tracker=tracker)
 
             # Ensure scripts are executable (POSIX)
-            ensure_executable_scripts(project_path, tracker=tracker)
+            ensure_executable_scripts(build_path, tracker=tracker)
 
             # Git step
             if not no_git:
                 tracker.start("git")
-                if is_git_repo(project_path):
+                if is_git_repo(build_path):
                     tracker.complete("git", "existing repo detected")
                 elif should_init_git:
-                    if init_git_repo(project_path, quiet=True):
+                    if init_git_repo(build_path, quiet=True):
                         tracker.complete("git", "initialized")
                     else:
                         tracker.error("git", "init failed")
@@ -1376,10 +2136,15 @@ def init(
             else:
                 tracker.skip("git", "--no-git flag")
 
+            if build_path != project_path:
+                build_complete = True
+                _rename_into_place(build_path, project_path)
             tracker.complete("final", "project ready")
-        except Exception as e:
-            tracker.error("final", str(e))
-            console.print(Panel(f"Initialization failed: {e}", title="Failure", border_style="red"))
+        except (Exception, KeyboardInterrupt) as e:
+            # A cancelled run cleans up too, so no stale .partial directory blocks the next init
+            reason = "interrupted" if isinstance(e, KeyboardInterrupt) else str(e)
+            tracker.error("final", reason)
+            console.print(Panel(f"Initialization failed: {reason}", title="Failure", border_style="red"))
             if debug:
                 _env_pairs = [
                     ("Python", sys.version.split()[0]),
@@ -1389,12 +2154,21 @@ def init(
                 _label_width = max(len(k) for k, _ in _env_pairs)
                 env_lines = [f"{k.ljust(_label_width)} → [bright_black]{v}[/bright_black]" for k, v in _env_pairs]
                 console.print(Panel("\n".join(env_lines), title="Debug Environment", border_style="magenta"))
-            if not here and project_path.exists():
-                shutil.rmtree(project_path)
+            if build_complete:
+                console.print(f"[yellow]The finished project was left at[/yellow] {build_path}")
+            elif build_path != project_path:
+                shutil.rmtree(build_path, ignore_errors=True)
             raise typer.Exit(1)
         finally:
-            # Force final render
-            pass
+            # Archives prefetched for agents that never got extracted (earlier failure)
+            for archive, _ in prefetched.values():
+                if isinstance(archive, Path):
+                    archive.unlink(missing_ok=True)
+                else:
+                    archive.close()
+            # The shared verified client is closed at exit; a --skip-tls client is ours to close
+            if local_client is not None and local_client is not _HTTPX_CLIENT:
+                local_client.close()
 
     # Final static tree (ensures finished state visible after Live context ends)
     console.print(tracker.render())
@@ -1477,91 +2251,77 @@ def init(
         return (base / ".claude/commands", "md", ["*.md"])
 
     def _parse_description(path: Path, fmt: str) -> str | None:
-        """Extract a short description from a command file by format."""
+        """Extract a short description from a command file by format.
+
+        Lines are read one at a time (text mode already normalizes newlines) and parsing
+        stops at the first answer or at the end of the frontmatter.
+        """
         try:
             with path.open("r", encoding="utf-8", errors="ignore") as f:
-                # Read a small header chunk
-                head = f.read(1000)
+                if fmt in ("md", "prompt.md"):
+                    # YAML frontmatter: --- ... description: ... ---
+                    in_frontmatter = False
+                    for ln in f:
+                        s = ln.strip()
+                        if not in_frontmatter:
+                            if not s:
+                                continue
+                            if s != "---":
+                                return None
+                            in_frontmatter = True
+                            continue
+                        if s == "---":
+                            return None
+                        if s.lower().startswith("description:"):
+                            return s.split(":", 1)[1].strip().strip('"').strip("'")
+                elif fmt == "toml":
+                    for ln in itertools.islice(f, 20):
+                        s = ln.strip()
+                        if s.startswith("description") and "=" in s:
+                            return s.split("=", 1)[1].strip().strip('"').strip("'")
         except (FileNotFoundError, PermissionError, UnicodeDecodeError):
             return None
-        # Normalize newlines
-        head = head.replace("\r\n", "\n").replace("\r", "\n")
-        if fmt in ("md", "prompt.md"):
-            # Look for YAML frontmatter: --- ... description: ... ---
-            if head.lstrip().startswith("---"):
-                # Take lines until the second '---'
-                fm = []
-                lines = head.split("\n")
-                dash_count = 0
-                for ln in lines:
-                    if ln.strip() == "---":
-                        dash_count += 1
-                        if dash_count == 2:
-                            break
-                        continue
-                    if dash_count == 1:
-                        fm.append(ln)
-                for ln in fm:
-                    if ln.strip().lower().startswith("description:"):
-                        return ln.split(":", 1)[1].strip().strip('"').strip("'")
-        elif fmt == "toml":
-            for ln in head.split("\n")[:20]:
-                s = ln.strip()
-                if s.startswith("description") and "=" in s:
-                    try:
-                        return s.split("=", 1)[1].strip().strip('"').strip("'")
-                    except Exception:
-                        return None
         return None
 
-    def _discover_commands(ai: str) -> list[tuple[str, str | None]]:
+    def _discover_commands(ai: str) -> list[tuple[str, Callable[[], str | None]]]:
+        """List (command name, description loader) pairs; descriptions are read only when printed."""
         cmd_dir, fmt, patterns = _agent_command_dir(ai)
-        candidates: list[Path] = []
+        try:
+            with os.scandir(cmd_dir) as it:
+                # entry.is_file() answers from the listing's d_type except for symlinks
+                entries = sorted((e for e in it if e.is_file()), key=lambda e: e.name)
+        except OSError:
+            return []
+        items: list[tuple[str, Callable[[], str | None]]] = []
         for pat in patterns:
-            candidates.extend(sorted(cmd_dir.glob(pat)))
-        items: list[tuple[str, str | None]] = []
-        for p in candidates:
-            if not p.is_file():
-                continue
-            name = p.stem
-            # For copilot .prompt.md -> strip .prompt suffix
-            if fmt == "prompt.md" and name.endswith(".prompt"):
-                name = name[:-7]
-            desc = _parse_description(p, fmt)
-            items.append((name, desc))
+            for entry in entries:
+                if not fnmatch.fnmatch(entry.name, pat):
+                    continue
+                name = os.path.splitext(entry.name)[0]
+                # For copilot .prompt.md -> strip .prompt suffix
+                if fmt == "prompt.md" and name.endswith(".prompt"):
+                    name = name[:-7]
+                items.append((name, functools.partial(_parse_description, Path(entry.path), fmt)))
         return items
 
     discovered_commands = {
         ai_key: _discover_commands(ai_key) for ai_key in selected_ais
     }
-    # Sort with a preferred core order first, then alphabetical
-    core_order = [
-        "constitution",
-        "specify",
-        "clarify",
-        "plan",
-        "tasks",
-        "analyze",
-        "implement",
-    ]
     steps_lines.append(f"{step_num}. Start using slash commands with your AI assistant(s):")
     sub_idx = 1
+    agent_labels = {ai_key: AI_CHOICES.get(ai_key, ai_key) for ai_key in selected_ais}
     for ai_key in selected_ais:
         commands = discovered_commands.get(ai_key, [])
         if not commands:
             continue
-        core = [c for c in commands if c[0] in core_order]
-        extra = [c for c in commands if c[0] not in core_order]
-        core.sort(key=lambda x: core_order.index(x[0]))
-        extra.sort(key=lambda x: x[0])
-        ordered = core + extra
-        agent_label = AI_CHOICES.get(ai_key, ai_key)
-        steps_lines.append(f"   {step_num}.{sub_idx} {agent_label} commands:")
-        for name, desc in ordered:
-            if desc:
-                steps_lines.append(f"      - [cyan]/{name}[/] - {desc}")
-            else:
-                steps_lines.append(f"      - [cyan]/{name}[/]")
+        # Preferred core order first, then alphabetical: non-core names all rank after the core set
+        non_core = len(_CORE_RANK)
+        ordered = sorted(commands, key=lambda c: (_CORE_RANK.get(c[0], non_core), c[0]))
+        steps_lines.append(f"   {step_num}.{sub_idx} {agent_labels[ai_key]} commands:")
+        steps_lines.extend(
+            f"      - [cyan]/{name}[/] - {desc}" if desc else f"      - [cyan]/{name}[/]"
+            for name, desc in ((name, load_desc()) for name, load_desc in ordered)
+        )
         sub_idx += 1
 
     steps_panel = Panel("\n".join(steps_lines), title="Next Steps", border_style="cyan", padding=(1,2))
@@ -1569,15 +2329,8 @@ def init(
     console.print(steps_panel)
 
     if "codex" in selected_ais:
-        warning_text = """[bold yellow]Important Note:[/bold yellow]
-
-Custom prompts do not yet support arguments in Codex. You may need to manually specify additional project instructions directly in prompt files located in [cyan].codex/prompts/[/cyan].
-
-For more information, see: [cyan]https://github.com/openai/codex/issues/2890[/cyan]"""
-        
-        warning_panel = Panel(warning_text, title="Slash Commands in Codex", border_style="yellow", padding=(1,2))
         console.print()
-        console.print(warning_panel)
+        console.print(_CODEX_WARNING_PANEL)
 
 @app.command()
 def check():
@@ -1586,40 +2339,21 @@ def check():
     console.print("[bold]Checking for installed tools...[/bold]\n")
 
     tracker = StepTracker("Check Available Tools")
-    
-    tracker.add("git", "Git version control")
-    tracker.add("claude", "Claude Code CLI")
-    tracker.add("gemini", "Gemini CLI")
-    tracker.add("qwen", "Qwen Code CLI")
-    tracker.add("code", "Visual Studio Code")
-    tracker.add("code-insiders", "Visual Studio Code Insiders")
-    tracker.add("cursor-agent", "Cursor IDE agent")
-    tracker.add("windsurf", "Windsurf IDE")
-    tracker.add("kilocode", "Kilo Code IDE")
-    tracker.add("opencode", "opencode")
-    tracker.add("codex", "Codex CLI")
-    tracker.add("auggie", "Auggie CLI")
-    
-    git_ok = check_tool_for_tracker("git", tracker)
-    claude_ok = check_tool_for_tracker("claude", tracker)  
-    gemini_ok = check_tool_for_tracker("gemini", tracker)
-    qwen_ok = check_tool_for_tracker("qwen", tracker)
-    code_ok = check_tool_for_tracker("code", tracker)
-    code_insiders_ok = check_tool_for_tracker("code-insiders", tracker)
-    cursor_ok = check_tool_for_tracker("cursor-agent", tracker)
-    windsurf_ok = check_tool_for_tracker("windsurf", tracker)
-    kilocode_ok = check_tool_for_tracker("kilocode", tracker)
-    opencode_ok = check_tool_for_tracker("opencode", tracker)
-    codex_ok = check_tool_for_tracker("codex", tracker)
-    auggie_ok = check_tool_for_tracker("auggie", tracker)
+    tracker.add_many(_CHECK_TOOLS)
+
+    tools = [tool for tool, _ in _CHECK_TOOLS]
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(len(tools), 8)) as pool:
+        tool_ok = dict(zip(tools, pool.map(lambda tool: check_tool_for_tracker(tool, tracker), tools)))
 
     console.print(tracker.render())
 
     console.print("\n[bold green]Specify CLI is ready to use![/bold green]")
 
-    if not git_ok:
+    if not tool_ok["git"]:
         console.print("[dim]Tip: Install git for repository management[/dim]")
-    if not (claude_ok or gemini_ok or cursor_ok or qwen_ok or windsurf_ok or kilocode_ok or opencode_ok or codex_ok or auggie_ok):
+    if not any(tool_ok[tool] for tool in _AI_ASSISTANT_TOOLS):
         console.print("[dim]Tip: Install an AI assistant for the best experience[/dim]")
 
 